@@ -3,57 +3,27 @@
 Script to create a Generative AI project structure and initialize it with GitHub
 """
 
+import functools
 import os
+import re
+import shlex
+import shutil
 import sys
-import subprocess
-import json
 from pathlib import Path
 
 
-def run_command(cmd, cwd=None, check=True):
-    """Execute a shell command and return the result"""
-    try:
-        result = subprocess.run(
-            cmd, 
-            shell=True, 
-            cwd=cwd, 
-            capture_output=True, 
-            text=True,
-            check=check
-        )
-        return result.returncode == 0, result.stdout, result.stderr
-    except Exception as e:
-        return False, "", str(e)
+# Valid project names: letters, numbers, - and _, starting with a letter or number
+PROJECT_NAME_RE = re.compile(r"\A[A-Za-z0-9][A-Za-z0-9_-]*\Z")
 
+# Identity used for the initial commit
+GIT_USER_NAME = "Your Name"
+GIT_USER_EMAIL = "you@example.com"
 
-def create_project_structure(project_path):
-    """Create the project folder structure"""
-    
-    directories = [
-        "config",
-        "data/cache",
-        "data/embeddings",
-        "data/vectordb",
-        "src/core",
-        "src/prompts",
-        "src/rag",
-        "src/processing",
-        "src/inference",
-        "docs",
-        "scripts",
-    ]
-    
-    for directory in directories:
-        full_path = os.path.join(project_path, directory)
-        os.makedirs(full_path, exist_ok=True)
-        print(f"[+] Created: {directory}")
-
+# Progress messages waiting to be written by _flush_log
+_log = []
 
-def create_config_files(project_path, project_name):
-    """Create configuration files"""
-    
-    # model_config.yaml
-    model_config = """# Model Configuration
+# model_config.yaml
+MODEL_CONFIG = """# Model Configuration
 models:
   - name: "gpt-4"
     provider: "openai"
@@ -68,12 +38,10 @@ models:
 embeddings:
   provider: "openai"
   model: "text-embedding-3-small"
-"""
-    with open(os.path.join(project_path, "config", "model_config.yaml"), "w") as f:
-        f.write(model_config)
-    
-    # logging_config.yaml
-    logging_config = """# Logging Configuration
+""".encode()
+
+# logging_config.yaml
+LOGGING_CONFIG = """# Logging Configuration
 version: 1
 disable_existing_loggers: false
 
@@ -92,19 +60,11 @@ root:
   level: INFO
   handlers:
     - console
-"""
-    with open(os.path.join(project_path, "config", "logging_config.yaml"), "w") as f:
-        f.write(logging_config)
-    
-    print("[+] Created: config/model_config.yaml")
-    print("[+] Created: config/logging_config.yaml")
-
+""".encode()
 
-def create_python_files(project_path):
-    """Create main Python files"""
-    
-    files = {
-        "src/core/base_llm.py": """\"\"\"Base LLM abstraction\"\"\"
+# Main Python files, as (path, content) pairs
+PYTHON_FILES = (
+    ("src/core/base_llm.py", """\"\"\"Base LLM abstraction\"\"\"
 
 class BaseLLM:
     def __init__(self, model_name: str):
@@ -112,9 +72,9 @@ class BaseLLM:
     
     def generate(self, prompt: str) -> str:
         raise NotImplementedError
-""",
-        
-        "src/core/gpt_client.py": """\"\"\"OpenAI GPT client\"\"\"
+""".encode()),
+
+    ("src/core/gpt_client.py", """\"\"\"OpenAI GPT client\"\"\"
 
 class GPTClient:
     def __init__(self, api_key: str):
@@ -122,9 +82,9 @@ class GPTClient:
     
     def chat(self, messages: list) -> str:
         pass
-""",
-        
-        "src/core/claude_client.py": """\"\"\"Anthropic Claude client\"\"\"
+""".encode()),
+
+    ("src/core/claude_client.py", """\"\"\"Anthropic Claude client\"\"\"
 
 class ClaudeClient:
     def __init__(self, api_key: str):
@@ -132,9 +92,9 @@ class ClaudeClient:
     
     def generate(self, prompt: str) -> str:
         pass
-""",
-        
-        "src/core/local_llm.py": """\"\"\"Local LLM implementation\"\"\"
+""".encode()),
+
+    ("src/core/local_llm.py", """\"\"\"Local LLM implementation\"\"\"
 
 class LocalLLM:
     def __init__(self, model_path: str):
@@ -142,9 +102,9 @@ class LocalLLM:
     
     def generate(self, prompt: str) -> str:
         pass
-""",
-        
-        "src/core/model_factory.py": """\"\"\"Model factory pattern\"\"\"
+""".encode()),
+
+    ("src/core/model_factory.py", """\"\"\"Model factory pattern\"\"\"
 
 class ModelFactory:
     @staticmethod
@@ -160,9 +120,9 @@ class ModelFactory:
             return LocalLLM(**kwargs)
         else:
             raise ValueError(f"Unknown model type: {model_type}")
-""",
-        
-        "src/prompts/templates.py": """\"\"\"Prompt templates\"\"\"
+""".encode()),
+
+    ("src/prompts/templates.py", """\"\"\"Prompt templates\"\"\"
 
 SYSTEM_PROMPT = \"\"\"You are a helpful AI assistant.\"\"\"
 
@@ -170,9 +130,9 @@ CHAT_TEMPLATE = \"\"\"
 User: {user_input}
 Assistant:
 \"\"\"
-""",
-        
-        "src/prompts/chain.py": """\"\"\"Prompt chaining\"\"\"
+""".encode()),
+
+    ("src/prompts/chain.py", """\"\"\"Prompt chaining\"\"\"
 
 class PromptChain:
     def __init__(self):
@@ -186,9 +146,9 @@ class PromptChain:
         for step in self.steps:
             result = step.format(input=result)
         return result
-""",
-        
-        "src/rag/embedder.py": """\"\"\"Embedding generation\"\"\"
+""".encode()),
+
+    ("src/rag/embedder.py", """\"\"\"Embedding generation\"\"\"
 
 class Embedder:
     def __init__(self, model: str = "text-embedding-3-small"):
@@ -196,9 +156,9 @@ class Embedder:
     
     def embed(self, text: str) -> list:
         pass
-""",
-        
-        "src/rag/retriever.py": """\"\"\"Document retrieval\"\"\"
+""".encode()),
+
+    ("src/rag/retriever.py", """\"\"\"Document retrieval\"\"\"
 
 class Retriever:
     def __init__(self, vector_store):
@@ -206,9 +166,9 @@ class Retriever:
     
     def retrieve(self, query: str, top_k: int = 5):
         pass
-""",
-        
-        "src/rag/vector_store.py": """\"\"\"Vector database interface\"\"\"
+""".encode()),
+
+    ("src/rag/vector_store.py", """\"\"\"Vector database interface\"\"\"
 
 class VectorStore:
     def add(self, documents: list):
@@ -216,9 +176,9 @@ class VectorStore:
     
     def search(self, query_vector: list, top_k: int = 5):
         pass
-""",
-        
-        "src/rag/indexer.py": """\"\"\"Document indexing\"\"\"
+""".encode()),
+
+    ("src/rag/indexer.py", """\"\"\"Document indexing\"\"\"
 
 class Indexer:
     def __init__(self, vector_store):
@@ -226,18 +186,18 @@ class Indexer:
     
     def index_documents(self, documents: list):
         pass
-""",
-        
-        "src/processing/chunking.py": """\"\"\"Text chunking\"\"\"
+""".encode()),
+
+    ("src/processing/chunking.py", """\"\"\"Text chunking\"\"\"
 
 def chunk_text(text: str, chunk_size: int = 512, overlap: int = 50) -> list:
     chunks = []
     for i in range(0, len(text), chunk_size - overlap):
         chunks.append(text[i:i + chunk_size])
     return chunks
-""",
-        
-        "src/processing/tokenizer.py": """\"\"\"Tokenization utilities\"\"\"
+""".encode()),
+
+    ("src/processing/tokenizer.py", """\"\"\"Tokenization utilities\"\"\"
 
 class Tokenizer:
     def __init__(self, model: str):
@@ -248,17 +208,17 @@ class Tokenizer:
     
     def count_tokens(self, text: str) -> int:
         pass
-""",
-        
-        "src/processing/preprocessor.py": """\"\"\"Text preprocessing\"\"\"
+""".encode()),
+
+    ("src/processing/preprocessor.py", """\"\"\"Text preprocessing\"\"\"
 
 def clean_text(text: str) -> str:
     # Remove extra whitespace
     text = ' '.join(text.split())
     return text
-""",
-        
-        "src/inference/inference_engine.py": """\"\"\"Inference orchestration\"\"\"
+""".encode()),
+
+    ("src/inference/inference_engine.py", """\"\"\"Inference orchestration\"\"\"
 
 class InferenceEngine:
     def __init__(self, model, retriever=None):
@@ -267,9 +227,9 @@ class InferenceEngine:
     
     def generate(self, prompt: str, context: str = None) -> str:
         pass
-""",
-        
-        "src/inference/response_parser.py": """\"\"\"Response parsing\"\"\"
+""".encode()),
+
+    ("src/inference/response_parser.py", """\"\"\"Response parsing\"\"\"
 
 class ResponseParser:
     @staticmethod
@@ -280,9 +240,9 @@ class ResponseParser:
     @staticmethod
     def parse_markdown(response: str) -> str:
         return response
-""",
-        
-        "main.py": """\"\"\"Main application entry point\"\"\"
+""".encode()),
+
+    ("main.py", """\"\"\"Main application entry point\"\"\"
 
 import logging
 from src.core.model_factory import ModelFactory
@@ -298,21 +258,11 @@ def main():
 
 if __name__ == "__main__":
     main()
-""",
-    }
-    
-    for filepath, content in files.items():
-        full_path = os.path.join(project_path, filepath)
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
-        with open(full_path, "w") as f:
-            f.write(content)
-        print(f"[+] Created: {filepath}")
-
+""".encode()),
+)
 
-def create_documentation(project_path):
-    """Create documentation"""
-    
-    readme = """# Generative AI Project
+# docs/README.md
+README = """# Generative AI Project
 
 A complete structure for generative AI projects.
 
@@ -352,9 +302,10 @@ uv run main.py
 
 ## Configuration
 
-Modify the files in the `config/` folder to adapt the parameters to your needs."""
-    
-    setup_doc = """# Installation and Setup
+Modify the files in the `config/` folder to adapt the parameters to your needs.""".encode()
+
+# docs/SETUP.md
+SETUP_DOC = """# Installation and Setup
 
 ## Prerequisites
 
@@ -412,23 +363,10 @@ To add new dependencies:
 ```bash
 uv pip install <package_name>
 ```
-"""
-    
-    with open(os.path.join(project_path, "docs", "README.md"), "w") as f:
-        f.write(readme)
-    
-    with open(os.path.join(project_path, "docs", "SETUP.md"), "w") as f:
-        f.write(setup_doc)
-    
-    print("[+] Created: docs/README.md")
-    print("[+] Created: docs/SETUP.md")
-
+""".encode()
 
-def create_additional_files(project_path):
-    """Create additional files"""
-    
-    # .gitignore
-    gitignore = """__pycache__/
+# .gitignore
+GITIGNORE = """__pycache__/
 *.py[cod]
 *$py.class
 *.so
@@ -472,10 +410,10 @@ data/vectordb/
 # OS
 .DS_Store
 Thumbs.db
-"""
-    
-    # requirements.txt
-    requirements = """python-dotenv==1.0.0
+""".encode()
+
+# requirements.txt
+REQUIREMENTS = """python-dotenv==1.0.0
 pyyaml==6.0
 openai==1.0.0
 anthropic==0.7.0
@@ -483,10 +421,10 @@ requests==2.31.0
 pytest>=7.0
 black>=23.0
 ruff>=0.1.0
-"""
-    
-    # pyproject.toml
-    pyproject = """[build-system]
+""".encode()
+
+# pyproject.toml
+PYPROJECT = """[build-system]
 requires = ["setuptools>=65.0"]
 build-backend = "setuptools.build_meta"
 
@@ -512,49 +450,235 @@ dev = [
 
 [tool.uv]
 python = "3.8"
-"""
-    
-    # .env.example
-    env_example = """# API Keys
+""".encode()
+
+# .env.example
+ENV_EXAMPLE = """# API Keys
 OPENAI_API_KEY=your-openai-api-key
 ANTHROPIC_API_KEY=your-anthropic-api-key
 
 # Configuration
 LOG_LEVEL=INFO
 MODEL_TYPE=gpt
-"""
+""".encode()
+
+# Every file of the scaffold, as (path, content) pairs
+SCAFFOLD_FILES = (
+    ("config/model_config.yaml", MODEL_CONFIG),
+    ("config/logging_config.yaml", LOGGING_CONFIG),
+) + PYTHON_FILES + (
+    ("docs/README.md", README),
+    ("docs/SETUP.md", SETUP_DOC),
+    (".gitignore", GITIGNORE),
+    ("requirements.txt", REQUIREMENTS),
+    ("pyproject.toml", PYPROJECT),
+    (".env.example", ENV_EXAMPLE),
+)
+
+
+def _say(msg):
+    """Queue a progress message"""
+    _log.append(msg)
+
+
+def _flush_log():
+    """Write all queued progress messages at once"""
+    if _log:
+        sys.stdout.write("\n".join(_log) + "\n")
+        sys.stdout.flush()
+        _log.clear()
+
+
+def run_command(cmd, cwd=None, check=True, capture=True):
+    """Execute a command (argv list) and return the result
+    
+    With capture=False the output is discarded and returned as empty strings.
+    """
+    # Imported here so the interactive prompts don't wait on it
+    import subprocess
+    
+    try:
+        if not capture:
+            result = subprocess.run(
+                cmd, 
+                cwd=cwd, 
+                stdout=subprocess.DEVNULL, 
+                stderr=subprocess.DEVNULL,
+                check=check
+            )
+            return result.returncode == 0, "", ""
+        result = subprocess.run(
+            cmd, 
+            cwd=cwd, 
+            capture_output=True, 
+            text=True,
+            check=check
+        )
+        return result.returncode == 0, result.stdout, result.stderr
+    except Exception as e:
+        return False, "", str(e)
+
+
+@functools.lru_cache(maxsize=32)
+def _check(*cmd):
+    """Return whether a side-effect-free query command succeeds, memoized per command"""
+    success, _, _ = run_command(list(cmd), capture=False)
+    return success
+
+
+@functools.lru_cache(maxsize=32)
+def _which(name):
+    """Memoized shutil.which"""
+    return shutil.which(name)
+
+
+def create_project_structure(project_path):
+    """Create the project folder structure and return the created directories"""
+    root = Path(project_path)
     
-    with open(os.path.join(project_path, ".gitignore"), "w") as f:
-        f.write(gitignore)
+    directories = [
+        "config",
+        "data/cache",
+        "data/embeddings",
+        "data/vectordb",
+        "src/core",
+        "src/prompts",
+        "src/rag",
+        "src/processing",
+        "src/inference",
+        "docs",
+        "scripts",
+    ]
     
-    with open(os.path.join(project_path, "requirements.txt"), "w") as f:
-        f.write(requirements)
+    # Only leaf directories need makedirs, their parents are created along the way
+    leaves = [
+        directory for directory in directories
+        if not any(other.startswith(directory + "/") for other in directories)
+    ]
     
-    with open(os.path.join(project_path, "pyproject.toml"), "w") as f:
-        f.write(pyproject)
+    created = set()
+    for directory in leaves:
+        (root / directory).mkdir(parents=True, exist_ok=True)
+        while directory and directory not in created:
+            created.add(directory)
+            directory = os.path.dirname(directory)
     
-    with open(os.path.join(project_path, ".env.example"), "w") as f:
-        f.write(env_example)
+    for directory in directories:
+        _say(f"[+] Created: {directory}")
     
-    print("[+] Created: .gitignore")
-    print("[+] Created: requirements.txt")
-    print("[+] Created: pyproject.toml")
-    print("[+] Created: .env.example")
+    return created
 
 
-def init_git_repo(project_path, project_name):
-    """Initialize a local Git repository"""
+def _write_bytes(path, data):
+    """Write data to path with raw os calls, skipping Python's file object layers"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def write_files(project_path, files, created=None):
+    """Write all (path, content) pairs, skipping directories already created"""
+    if not files:
+        return
+    
+    root = Path(project_path)
+    created = set() if created is None else created
+    
+    # Create every missing parent directory in one pass before writing
+    for filepath, _ in files:
+        directory = os.path.dirname(filepath)
+        if directory and directory not in created:
+            (root / directory).mkdir(parents=True, exist_ok=True)
+            created.add(directory)
+    
+    # Files are written directly rather than packed into an in-memory tar and
+    # extracted: tarfile still creates every member with its own open/write/close
+    # (plus chmod/utime), so a bundle would only add work on top of these writes.
+    # They are written serially, since for a few dozen small files a thread
+    # pool costs more than it saves.
+    for filepath, content in files:
+        _write_bytes(root / filepath, content)
+        _say(f"[+] Created: {filepath}")
+
+
+def init_git_repo_dulwich(project_path, commit_message, paths):
+    """Initialize a new Git repository and commit the given files with dulwich"""
+    try:
+        from dulwich import porcelain
+    except ImportError:  # dulwich is optional, git is used instead
+        return False
+    
+    try:
+        repo = porcelain.init(project_path)
+        config = repo.get_config()
+        config.set((b"user",), b"email", GIT_USER_EMAIL.encode())
+        config.set((b"user",), b"name", GIT_USER_NAME.encode())
+        config.write_to_path()
+        repo.refs.set_symbolic_ref(b"HEAD", b"refs/heads/main")
+        
+        # Stage explicit absolute paths: without them dulwich walks the current
+        # directory, which is the parent of the project
+        root = os.path.abspath(project_path)
+        porcelain.add(repo, paths=[os.path.join(root, path) for path in paths])
+        
+        identity = f"{GIT_USER_NAME} <{GIT_USER_EMAIL}>".encode()
+        porcelain.commit(repo, message=commit_message.encode(), author=identity, committer=identity)
+        return True
+    except Exception as e:
+        print(f"[!] dulwich failed ({e}), falling back to git")
+        return False
+
+
+def init_git_repo(project_path, project_name, commit_message="Initial commit: Generative AI project structure", paths=None):
+    """Initialize a local Git repository and create the initial commit
+    
+    paths lists every project-relative file in the working tree; it enables
+    the dulwich fast path, otherwise git stages the tree with `git add .`. Returns (initialized, committed), where committed
+    is False when the commit failed and the project files are left staged.
+    """
     print("\n[*] Initializing Git repository...")
-    success, _, _ = run_command("git init -b main", cwd=project_path)
-    if success:
-        print("[+] Git repository initialized")
-        run_command("git config user.email 'you@example.com'", cwd=project_path)
-        run_command("git config user.name 'Your Name'", cwd=project_path)
-    else:
+    
+    # dulwich avoids spawning git at all, but only handles fresh repositories
+    success = False
+    if paths and not os.path.exists(os.path.join(project_path, ".git")):
+        success = init_git_repo_dulwich(project_path, commit_message, paths)
+    commit_status = "committed" if success else None
+    
+    if not success:
+        # Run the whole sequence in a single shell instead of one process per step.
+        # Only the setup is fatal; the commit outcome is reported on stdout.
+        setup = " && ".join([
+            "git init -b main",
+            f"git config user.email {shlex.quote(GIT_USER_EMAIL)}",
+            f"git config user.name {shlex.quote(GIT_USER_NAME)}",
+            "git add .",
+        ])
+        script = "\n".join([
+            f"{{ {setup}; }} >/dev/null 2>&1 || exit 1",
+            "if git diff --cached --quiet; then echo unchanged",
+            f"elif git commit -m {shlex.quote(commit_message)} >/dev/null 2>&1; then echo committed",
+            "else echo failed; fi",
+        ])
+        success, stdout, _ = run_command(["bash", "-c", script], cwd=project_path)
+        commit_status = stdout.strip()
+    
+    if not success:
         print("[-] Error during Git initialization")
-        return False
+        return False, False
     
-    return True
+    print("[+] Git repository initialized")
+    if commit_status == "committed":
+        print("[+] Initial commit created successfully")
+    elif commit_status == "unchanged":
+        print("[*] No changes to commit")
+    else:
+        print("[!] Initial commit failed, continuing without it")
+    
+    return True, commit_status != "failed"
 
 
 def create_github_repo(project_name, project_path, is_public=True):
@@ -562,15 +686,13 @@ def create_github_repo(project_name, project_path, is_public=True):
     print("\n[*] Creating GitHub repository...")
     
     # Check if gh CLI is installed
-    success, _, _ = run_command("which gh")
-    if not success:
+    if _which("gh") is None:
         print("[!] GitHub CLI (gh) is not installed")
         print("Install it from: https://github.com/cli/cli/releases")
         return False
     
     # Check authentication
-    success, _, _ = run_command("gh auth status")
-    if not success:
+    if not _check("gh", "auth", "status"):
         print("[!] You are not authenticated on GitHub")
         print("Authenticate with: gh auth login")
         return False
@@ -578,7 +700,7 @@ def create_github_repo(project_name, project_path, is_public=True):
     # Create the repo (public or private)
     visibility = "--public" if is_public else "--private"
     repo_type = "public" if is_public else "private"
-    cmd = f'gh repo create {project_name} {visibility} --source=. --remote=origin --push'
+    cmd = ["gh", "repo", "create", project_name, visibility, "--source=.", "--remote=origin", "--push"]
     success, stdout, stderr = run_command(cmd, cwd=project_path)
     
     if success:
@@ -590,8 +712,9 @@ def create_github_repo(project_name, project_path, is_public=True):
             print("[!] Repository already exists on GitHub")
             print("[*] Trying to push to existing repository...")
             # Try to set remote and push
-            run_command(f"git remote add origin git@github.com:TimotheeNkwar/{project_name}.git", cwd=project_path)
-            success, _, _ = run_command("git push -u origin main", cwd=project_path)
+            remote_url = shlex.quote(f"git@github.com:TimotheeNkwar/{project_name}.git")
+            script = f"git remote add origin {remote_url}; git push -u origin main"
+            success, _, _ = run_command(["bash", "-c", script], cwd=project_path, capture=False)
             if success:
                 print("[+] Code pushed to existing repository")
                 return True
@@ -600,22 +723,21 @@ def create_github_repo(project_name, project_path, is_public=True):
         return False
 
 
-def push_to_github(project_path):
-    """Push initial code to GitHub"""
-    print("\n[*] Checking for commits to push...")
+def push_to_github(project_path, has_changes=True):
+    """Push initial code to GitHub
     
-    # Check if there are any uncommitted changes
-    success, stdout, _ = run_command("git status --porcelain", cwd=project_path)
+    has_changes tells whether the working tree may hold uncommitted files,
+    which avoids asking git for its status.
+    """
+    print("\n[*] Checking for commits to push...")
     
-    if stdout.strip():  # If there are changes
-        print("[*] Uncommitted changes found, committing...")
-        # Add all files
-        run_command("git add .", cwd=project_path)
-        
-        # Commit
+    if has_changes:
+        print("[*] Committing project files...")
+        # Add and commit all files
         success, _, _ = run_command(
-            'git commit -m "Project files"',
-            cwd=project_path
+            ["bash", "-c", "git add . && git commit -m 'Project files'"],
+            cwd=project_path,
+            capture=False
         )
         
         if success:
@@ -626,11 +748,11 @@ def push_to_github(project_path):
         print("[*] No uncommitted changes")
     
     # Check if remote exists
-    success, _, _ = run_command("git remote get-url origin", cwd=project_path)
+    success, _, _ = run_command(["git", "remote", "get-url", "origin"], cwd=project_path, capture=False)
     if success:
         print("[*] Pushing to GitHub...")
         # Push
-        success, _, _ = run_command("git push -u origin main", cwd=project_path)
+        success, _, _ = run_command(["git", "push", "-u", "origin", "main"], cwd=project_path, capture=False)
         
         if success:
             print("[+] Code pushed to GitHub")
@@ -656,46 +778,40 @@ def main():
         sys.exit(1)
     
     # Validate the name
-    if not project_name.replace("-", "").replace("_", "").isalnum():
-        print("[-] Project name must contain only letters, numbers, - and _")
+    if not PROJECT_NAME_RE.match(project_name):
+        print("[-] Project name must contain only letters, numbers, - and _, and start with a letter or number")
         sys.exit(1)
     
     # Create the project path
     project_path = os.path.join(os.getcwd(), project_name)
     
-    # Check if folder exists
-    if os.path.exists(project_path):
+    # Create the folder, finding out in the same call whether it already existed
+    try:
+        os.makedirs(project_path)
+        is_new_folder = True
+    except FileExistsError:
+        is_new_folder = False
         response = input(f"[!] Folder '{project_name}' already exists. Continue? (y/n): ")
         if response.lower() != "y":
             print("[-] Operation cancelled")
             sys.exit(1)
-    else:
-        os.makedirs(project_path, exist_ok=True)
     
     print(f"\n[*] Creating project in: {project_path}\n")
     
     # Create the structure
-    create_project_structure(project_path)
-    create_config_files(project_path, project_name)
-    create_python_files(project_path)
-    create_documentation(project_path)
-    create_additional_files(project_path)
+    created = create_project_structure(project_path)
+    write_files(project_path, SCAFFOLD_FILES, created)
+    _flush_log()
     
     # Initialize Git
-    if not init_git_repo(project_path, project_name):
+    # A folder created by this run holds nothing but the scaffold, so its file
+    # list is known and dulwich commits exactly what `git add .` would
+    paths = [path for path, _ in SCAFFOLD_FILES] if is_new_folder else None
+    initialized, committed = init_git_repo(project_path, project_name, paths=paths)
+    if not initialized:
         print("[!] Continuing without Git...")
         return
     
-    # Make initial commit
-    print("\n[*] Creating initial commit...")
-    success, _, _ = run_command("git add .", cwd=project_path)
-    success, _, _ = run_command(
-        'git commit -m "Initial commit: Generative AI project structure"',
-        cwd=project_path
-    )
-    if success:
-        print("[+] Initial commit created successfully")
-    
     # Create GitHub repo
     print("\n[*] GitHub integration (optional)...")
     is_public = True  # Default
@@ -709,7 +825,8 @@ def main():
         print("[*] Repository will be created as public")
     
     if create_github_repo(project_name, project_path, is_public):
-        push_to_github(project_path)
+        # Only commit again if init_git_repo left the files staged
+        push_to_github(project_path, has_changes=not committed)
         print("\n" + "=" * 60)
         print("[+] Project created and pushed to GitHub!")
         print("=" * 60)
@@ -725,7 +842,10 @@ def main():
         print("[+] Project created successfully!")
         print("=" * 60)
         print(f"\n[*] Location: {project_path}")
-        print(f"[*] Git repository initialized with initial commit")
+        if committed:
+            print(f"[*] Git repository initialized with initial commit")
+        else:
+            print(f"[!] Git repository initialized, but the initial commit failed (files are staged)")
         print(f"\n[*] Next steps:")
         print(f"   1. cd {project_name}")
         print(f"   2. Configure your API keys in .env")